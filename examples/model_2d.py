@@ -8,7 +8,6 @@ a subducting slab and a few different interfaces, each one with a different phys
 parameters.
 """
 import numpy as np
-import xarray as xr
 import matplotlib.pyplot as plt
 import modelling_earth as me
 
@@ -55,49 +54,53 @@ temperature = me.subducting_slab_temperature(
 
 # Interfaces
 # ==========
+# Build every interface profile with vectorized masks over the x coordinate in a
+# single pass each, instead of assigning every region through separate .loc indexers.
+x = coordinates["x"].values
+before_slab = x < slab_xmin
+after_slab = x > slab_xmax
+
 # Lets create the interface for the true LID, i.e. the one that includes the subducting
-# slab
-lid = me.create_interface(coordinates)
-lid.loc[dict(x=(lid.x < slab_xmin))] = oceanic_lid_depth
-lid.loc[dict(x=(lid.x > slab_xmax))] = me.linear_depth(
-    slab_xmax, slab_slope, (slab_xmin, oceanic_lid_depth)
-)
-x_slab = lid.x[(lid.x >= slab_xmin) & (lid.x <= slab_xmax)]
-lid.loc[dict(x=x_slab)] = me.linear_depth(
-    x_slab, slab_slope, (slab_xmin, oceanic_lid_depth)
+# slab. After the slab the LID stays at the depth it reaches on slab_xmax.
+slab_lid = me.linear_depth(
+    np.minimum(x, slab_xmax), slab_slope, (slab_xmin, oceanic_lid_depth)
 )
+lid_values = np.where(before_slab, oceanic_lid_depth, slab_lid)
 
 # Now lets create the interface for the bottom of the oceanic crust
-bottom_oceanic_crust = lid + slab_thickness - oceanic_crust_thickness
-x_after_slab = dict(x=(lid.x > slab_xmax))
-bottom_oceanic_crust.loc[x_after_slab] = lid.loc[x_after_slab]
+bottom_oceanic_crust_values = np.where(
+    after_slab, lid_values, lid_values + slab_thickness - oceanic_crust_thickness
+)
 
 # Top of the oceanic crust
-top_oceanic_crust = bottom_oceanic_crust + oceanic_crust_thickness
-top_oceanic_crust[x_after_slab] = lid.loc[x_after_slab]
+top_oceanic_crust_values = np.where(
+    after_slab, lid_values, bottom_oceanic_crust_values + oceanic_crust_thickness
+)
 
 # Bottom of continental lithosphere
-bottom_continental_litho = top_oceanic_crust.copy()
-bottom_continental_litho.loc[x_after_slab] = continental_lid_depth
-
-# Bottom of the continental crust
-bottom_continental_crust = xr.where(
-    bottom_continental_litho < continental_crust_depth,
-    continental_crust_depth,
-    bottom_continental_litho,
+bottom_continental_litho_values = np.where(
+    after_slab, continental_lid_depth, top_oceanic_crust_values
 )
 
-# Lets merge the interfaces
-interfaces = me.merge_interfaces(
-    {
-        "lid": lid,
-        "bottom_oceanic_crust": bottom_oceanic_crust,
-        "top_oceanic_crust": top_oceanic_crust,
-        "bottom_continental_litho": bottom_continental_litho,
-        "bottom_continental_crust": bottom_continental_crust,
-    }
+# Bottom of the continental crust: since depths are negative, clipping the
+# lithosphere bottom from below is a plain element-wise maximum
+bottom_continental_crust_values = np.maximum(
+    bottom_continental_litho_values, continental_crust_depth
 )
 
+# Wrap the profiles as interfaces on the grid coordinates and merge them
+interfaces = {}
+for name, values in (
+    ("lid", lid_values),
+    ("bottom_oceanic_crust", bottom_oceanic_crust_values),
+    ("top_oceanic_crust", top_oceanic_crust_values),
+    ("bottom_continental_litho", bottom_continental_litho_values),
+    ("bottom_continental_crust", bottom_continental_crust_values),
+):
+    interfaces[name] = me.create_interface(coordinates)
+    interfaces[name].values[:] = values
+interfaces = me.merge_interfaces(interfaces)
+
 
 # Plot
 # ====
@@ -14,29 +14,29 @@ mandyoc_output_path = os.path.join(script_path, "data", "data_2d")
 dataset = me.read_mandyoc_data(
     mandyoc_output_path, datasets=["temperature", "density", "velocity", "viscosity"]
 )
-print(dataset)
+# Print only the metadata: the sizes and the available data variables
+print(dict(dataset.sizes), list(dataset.data_vars))
 
 # Plot single frame (for t=0)
-fig, ax = plt.subplots()
+# Share a single figure between both plots instead of building one figure and
+# backend canvas per plot
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 # Plot temeprature and velocity
-me.plot_scalar_2d(dataset.temperature.sel(time=0), ax=ax)
-me.plot_velocity_2d(dataset.sel(time=0), ax=ax, slice_grid=(4, 3))
-ax.ticklabel_format(axis="both", style="sci", scilimits=(0, 0))
-ax.set_aspect("equal")
-plt.show()
+# Select with drop=True so the scalar time coordinate is not carried around by
+# the plotted slices
+me.plot_scalar_2d(dataset.temperature.sel(time=0, drop=True), ax=ax1)
+me.plot_velocity_2d(dataset.sel(time=0, drop=True), ax=ax1, slice_grid=(4, 3))
 # Plot the viscosity
-# me.plot_scalar_2d(dataset.viscosity.sel(time=0, y_center=0), ax=ax)
-fig, ax = plt.subplots()
-dataset.viscosity.sel(time=0).plot.pcolormesh(
-    ax=ax, x="x_center", y="z_center", norm=LogNorm()
+dataset.viscosity.sel(time=0, drop=True).plot.pcolormesh(
+    ax=ax2, x="x_center", y="z_center", norm=LogNorm()
 )
-ax.ticklabel_format(axis="both", style="sci", scilimits=(0, 0))
-ax.set_aspect("equal")
+for ax in (ax1, ax2):
+    ax.ticklabel_format(axis="both", style="sci", scilimits=(0, 0))
+    ax.set_aspect("equal")
 plt.show()
 
 # Plot all temperatures and velocities for every time and save the figures
 # Create filter to get only the y=0 profile of the dataset
 figs_dir = os.path.join(script_path, "_figures")
-if not os.path.isdir(figs_dir):
-    os.mkdir(figs_dir)
+os.makedirs(figs_dir, exist_ok=True)
 me.save_plots_2d(dataset, figs_dir, scalar_to_plot="temperature")
@@ -12,7 +12,7 @@ mandyoc_output_path = os.path.join(script_path, "run")
 # Read the particles position
 swarm = me.read_mandyoc_swarm(mandyoc_output_path)
 # Reduce the number of particles to take only 2 particle per cell
-swarm = swarm[swarm.cc0 < 2]
+swarm = swarm.query("cc0 < 2")
 
 # Read the MANDYOC output files
 dataset = me.read_mandyoc_data(mandyoc_output_path)
@@ -29,8 +29,7 @@ plt.show()
 
 # Plot all temperatures and particle position for every time and save the figures
 figs_dir = os.path.join(script_path, "_figures")
-if not os.path.isdir(figs_dir):
-    os.mkdir(figs_dir)
+os.makedirs(figs_dir, exist_ok=True)
 me.save_plots_2d(
     dataset.sel(y=0),
     figs_dir,
@@ -21,8 +21,13 @@ coordinates = me.grid_coordinates(region, shape)
 lid = me.create_grid(coordinates).sel(z=coordinates["z"][0])
 # Then we can fill the LID profile with our values. For example, lets propose a LID
 # boundary that oscilates in x
-lid += -300e3
-lid += 30e3 * np.sin(lid.x / 100e3)
+# Operate on the raw values to skip the xarray alignment machinery, using the lid
+# array itself as the output of every step so no temporary arrays are allocated
+lid_values = lid.values
+np.divide(lid.x.values, 100e3, out=lid_values)
+np.sin(lid_values, out=lid_values)
+np.multiply(lid_values, 30e3, out=lid_values)
+lid_values += -300e3
 
 # Create a temperature distribution for a lithosphere and an asthenosphere passing the
 # custom LID boundary
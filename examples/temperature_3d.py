@@ -20,11 +20,11 @@ coordinates = me.grid_coordinates(region, shape)
 # We can create a xarray.DataArray full of zeros by copying the temperature grid while
 # fixing a single value of z, in order to create a surface, rather than copying the
 # entire grid:
-lid = me.initialize_array(coordinates).sel(z=coordinates["z"][0])
+lid = me.create_grid(coordinates).sel(z=coordinates["z"][0])
 # Then we can fill the LID surface with our values. For example, we can set two constant
-# depths for different regions in x:
-lid[lid.x < 500e3] = -150e3
-lid[lid.x >= 500e3] = -300e3
+# depths for different regions in x. A single np.where pass fills both regions at once,
+# broadcasting the x profile over the y direction.
+lid.values[:] = np.where(lid.x.values < 500e3, -150e3, -300e3)[:, np.newaxis]
 
 # Create a temperature distribution for a lithosphere and an asthenosphere passing the
 # custom LID boundary
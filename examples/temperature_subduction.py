@@ -35,7 +35,8 @@ lid_points = (
         continental_lid_depth,
     ],
 )
-lid += np.interp(lid.x, *lid_points)
+# Interpolate on the raw values to skip the xarray alignment machinery
+lid.values[:] = np.interp(lid.x.values, *lid_points)
 
 # Create a temperature distribution for a lithosphere and an asthenosphere passing the
 # custom LID boundary
@@ -9,8 +9,7 @@ import os
 # Get path to the MANDYOC output directory
 script_path = os.path.dirname(os.path.abspath(__file__))
 mandyoc_input_path = os.path.join(script_path, "_input_data")
-if not os.path.isdir(mandyoc_input_path):
-    os.mkdir(mandyoc_input_path)
+os.makedirs(mandyoc_input_path, exist_ok=True)
 
 # Define a region of study and the number of nodes per axes
 x_min, x_max, z_min, z_max = 0, 2000e3, -660e3, 0
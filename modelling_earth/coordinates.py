@@ -1,11 +1,13 @@
 """
 Functions to create coordinates and initilize empty arrays
 """
+import functools
+
 import numpy as np
 import xarray as xr
 
 
-def grid_coordinates(region, shape):
+def grid_coordinates(region, shape, dtype=np.float64):
     """
     Create grid coordinates for 2D and 3D models
 
@@ -21,11 +23,29 @@ def grid_coordinates(region, shape):
         Total number of grid points along each direction.
         If the grid is 3D, the tuple must be: ``n_x``, ``n_y``, ``n_z``.
         If the grid is 2D, the tuple must be: ``n_x``, ``n_z``.
+    dtype : data-type (optional)
+        Type for the coordinates arrays. Single precision is enough for
+        visualization-only workflows and halves the memory moved by broadcast
+        operations on the grid. Default to ``numpy.float64``.
 
     Returns
     -------
-    coordinates : :class:`xarray.DataArrayCoordinates`
+    coordinates : :class:`xarray.Coordinates`
         Coordinates located on a regular grid.
+
+    Notes
+    -----
+    The coordinates are cached on ``region`` and ``shape``, so repeated calls with the
+    same arguments return the same object instead of rebuilding the arrays. Avoid
+    modifying the returned coordinates in place.
+    """
+    return _grid_coordinates(tuple(region), tuple(shape), np.dtype(dtype))
+
+
+@functools.lru_cache(maxsize=32)
+def _grid_coordinates(region, shape, dtype):
+    """
+    Build grid coordinates, caching the result on region, shape and dtype
     """
     # Sanity checks
     _check_region(region)
@@ -34,23 +54,22 @@ def grid_coordinates(region, shape):
     if len(shape) == 2:
         nx, nz = shape[:]
         x_min, x_max, z_min, z_max = region[:]
-        x = np.linspace(x_min, x_max, nx)
-        z = np.linspace(z_min, z_max, nz)
-        dims = ("x", "z")
+        x = np.linspace(x_min, x_max, nx, dtype=dtype)
+        z = np.linspace(z_min, z_max, nz, dtype=dtype)
         coords = {"x": x, "z": z}
     else:
         nx, ny, nz = shape[:]
         x_min, x_max, y_min, y_max, z_min, z_max = region[:]
-        x = np.linspace(x_min, x_max, nx)
-        y = np.linspace(y_min, y_max, ny)
-        z = np.linspace(z_min, z_max, nz)
-        dims = ("x", "y", "z")
+        x = np.linspace(x_min, x_max, nx, dtype=dtype)
+        y = np.linspace(y_min, y_max, ny, dtype=dtype)
+        z = np.linspace(z_min, z_max, nz, dtype=dtype)
         coords = {"x": x, "y": y, "z": z}
-    da = xr.DataArray(np.zeros(shape), coords=coords, dims=dims)
-    return da.coords
+    # Assemble the coordinates from the 1d arrays without materializing a dense
+    # zero-filled array of the full grid shape
+    return xr.Dataset(coords=coords).coords
 
 
-def create_grid(coordinates, fill_value=0):
+def create_grid(coordinates, fill_value=0, dtype=np.float64):
     """
     Create an empty array for a set of coordinates
 
@@ -62,12 +81,16 @@ def create_grid(coordinates, fill_value=0):
     fill_value : float (optional) or None
         Value that will fill the initialized array. If None, the array will be filled
         with ``numpy.nan``s. Default to 0.
+    dtype : data-type (optional)
+        Type for the created array. Default to ``numpy.float64``.
     """
     # Get shape of coordinates
     shape = get_shape(coordinates)
     if fill_value is None:
         fill_value = np.nan
-    return xr.DataArray(fill_value * np.ones(shape), coords=coordinates)
+    # Fill the array on allocation: multiplying np.ones would write the full array
+    # twice and build a temporary copy
+    return xr.DataArray(np.full(shape, fill_value, dtype=dtype), coords=coordinates)
 
 
 def get_shape(coordinates):
@@ -84,7 +107,9 @@ def get_shape(coordinates):
     shape : tuple
         Tuple containing the shape of the coordinates
     """
-    return tuple(coordinates[i].size for i in coordinates.dims)
+    # Read the sizes mapping instead of indexing the coordinates, which would build
+    # a DataArray for every dimension just to ask for its size
+    return tuple(coordinates.sizes[dim] for dim in coordinates.dims)
 
 
 def _check_region(region):
@@ -92,29 +117,21 @@ def _check_region(region):
     Sanity checks for region
     """
     if len(region) == 4:
-        x_min, x_max, z_min, z_max = region
+        dims = ("x", "z")
     elif len(region) == 6:
-        x_min, x_max, y_min, y_max, z_min, z_max = region
-        if x_min > x_max:
-            raise ValueError(
-                "Invalid region '{}' (x_min, x_max, z_min, z_max). ".format(region)
-                + "Must have y_min =< y_max. "
-            )
+        dims = ("x", "y", "z")
     else:
         raise ValueError(
             "Invalid region '{}'. ".format(region)
             + "Only 4 or 6 values allowed for 2D and 3D dimensions, respectively."
         )
-    if x_min > x_max:
-        raise ValueError(
-            "Invalid region '{}' (x_min, x_max, z_min, z_max). ".format(region)
-            + "Must have x_min =< x_max. "
-        )
-    if z_min > z_max:
-        raise ValueError(
-            "Invalid region '{}' (x_min, x_max, z_min, z_max). ".format(region)
-            + "Must have z_min =< z_max. "
-        )
+    # Check every (min, max) pair in a single loop instead of one branch per direction
+    for dim, minimum, maximum in zip(dims, region[0::2], region[1::2]):
+        if minimum > maximum:
+            raise ValueError(
+                "Invalid region '{}'. ".format(region)
+                + "Must have {dim}_min =< {dim}_max. ".format(dim=dim)
+            )
 
 
 def _check_region_shape(region, shape):
@@ -35,8 +35,10 @@ def create_interface(coordinates, fill_value=0):
         fill_value = np.nan
     # Remove the shape on z
     shape = shape[:-1]
+    # Fill the array on allocation: multiplying np.ones would write the full array
+    # twice and build a temporary copy
     return xr.DataArray(
-        fill_value * np.ones(shape),
+        np.full(shape, fill_value, dtype=np.float64),
         coords=[coordinates[i] for i in coordinates if i != "z"],
     )
 
@@ -55,13 +57,9 @@ def merge_interfaces(interfaces):
     ds : :class:`xarray.Dataset`
         Dataset containing the interfaces.
     """
-    ds = None
-    for name, interface in interfaces.items():
-        if ds:
-            ds[name] = interface
-        else:
-            ds = interfaces[name].to_dataset(name=name)
-    return ds
+    # Build the dataset in a single pass instead of assigning one interface at a time,
+    # which would realign the coordinates on every assignment
+    return xr.Dataset(interfaces)
 
 
 def interface_from_vertices(vertices, coordinates, direction="x"):
@@ -88,13 +86,13 @@ def interface_from_vertices(vertices, coordinates, direction="x"):
     h_min, h_max = coordinates[direction].min(), coordinates[direction].max()
     vertices = np.array(vertices)
     _check_boundary_vertices(vertices, h_min, h_max)
-    interface = np.interp(coordinates[direction], vertices[:, 0], vertices[:, 1])
+    interface = np.interp(coordinates[direction].values, vertices[:, 0], vertices[:, 1])
     da = xr.DataArray(interface, coords=[coordinates[direction]], dims=direction)
     if len(coordinates.dims) == 3:
         if direction == "x":
             missing_dim = "y"
         elif direction == "y":
-            missing_dim == "x"
+            missing_dim = "x"
         da = da.expand_dims({missing_dim: coordinates[missing_dim].size})
         da.coords[missing_dim] = coordinates[missing_dim]
         da = da.transpose("x", "y")
@@ -2,6 +2,12 @@
 Read and write data structured in regular grids
 """
 import os
+import re
+import hashlib
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import xarray as xr
 import pandas as pd
@@ -33,7 +39,13 @@ DATASETS = (
 SCALARS_ON_NODES = DATASETS[:6]
 
 
-def read_mandyoc_data(path, parameters_file=PARAMETERS_FILE, datasets=DATASETS):
+def read_mandyoc_data(
+    path,
+    parameters_file=PARAMETERS_FILE,
+    datasets=DATASETS,
+    dtype=np.float64,
+    cache=False,
+):
     """
     Read the MANDYOC output files
 
@@ -56,14 +68,54 @@ def read_mandyoc_data(path, parameters_file=PARAMETERS_FILE, datasets=DATASETS):
             - ``viscosity``
             - ``velocity``
         By default, every dataset will be read.
+    dtype : data-type (optional)
+        Type for the data arrays of the returned dataset. Pass ``numpy.float32`` to
+        halve the memory taken by large models when single precision is enough for
+        plotting or post-processing. The coordinates are always kept in double
+        precision. Default to ``numpy.float64``.
+    cache : bool (optional)
+        If ``True``, the parsed dataset is stored as a netCDF file inside ``path``
+        on the first read and reloaded from it afterwards, skipping the text
+        parsing entirely. The cached file is rebuilt if the grid shape or region in
+        the parameters file changes. Default to ``False``.
 
     Returns
     -------
     dataset :  :class:`xarray.Dataset`
         Dataset containing data generated by MADYOC.
+
+    Notes
+    -----
+    The parsed dataset is cached in memory, so repeated reads of the same directory
+    (e.g. while iterating on plots) skip parsing the output files again. The returned
+    dataset is a shallow copy of the cached one: the underlying arrays are shared, so
+    avoid modifying their values in place.
+    """
+    dataset = _read_mandyoc_data(
+        os.path.abspath(path),
+        parameters_file,
+        tuple(datasets),
+        np.dtype(dtype),
+        bool(cache),
+    )
+    return dataset.copy(deep=False)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_mandyoc_data(path, parameters_file, datasets, dtype, cache):
+    """
+    Read the MANDYOC output files, caching the parsed dataset
     """
     # Read parameters
     parameters = _read_parameters(os.path.join(path, parameters_file))
+    # Reload the dataset from the netCDF cache if a valid one is on disk
+    if cache:
+        cache_file = os.path.join(
+            path, _cache_filename(parameters_file, datasets, dtype)
+        )
+        dataset = _load_cached_dataset(cache_file, parameters)
+        if dataset is not None:
+            return dataset
     # Build coordinates
     shape = parameters["shape"]
     coordinates = _build_coordinates(region=parameters["region"], shape=shape)
@@ -82,48 +134,131 @@ def read_mandyoc_data(path, parameters_file=PARAMETERS_FILE, datasets=DATASETS):
         dims = ("time", "x", "y", "z")
         coords["x"], coords["y"], coords["z"] = coordinates[:]
 
-    # Create a dictionary containig the scalar data (no velocity nor viscosity)
-    data_vars = {
-        scalar: (dims, _read_scalars(path, shape, steps, quantity=scalar))
-        for scalar in datasets
-        if scalar in SCALARS_ON_NODES
-    }
-
-    # Read velocity if needed
-    if "velocity" in datasets:
-        velocities = _read_velocity(path, shape, steps)
-        if dimension == 2:
-            data_vars["velocity_x"] = (dims, velocities[0])
-            data_vars["velocity_z"] = (dims, velocities[1])
-        elif dimension == 3:
-            data_vars["velocity_x"] = (dims, velocities[0])
-            data_vars["velocity_y"] = (dims, velocities[1])
-            data_vars["velocity_z"] = (dims, velocities[2])
+    # Read every requested quantity on a shared thread pool. The parallel unit is a
+    # single output file, so the pool stays saturated no matter how many quantities
+    # were requested: the files are independent and the pandas C tokenizer releases
+    # the GIL while parsing.
+    scalars = [scalar for scalar in datasets if scalar in SCALARS_ON_NODES]
+    with ThreadPoolExecutor() as executor:
+        # Submit the viscosity read first so its rank files overlap the node reads
+        if "viscosity" in datasets:
+            future_viscosity = executor.submit(
+                _read_viscosity, path, steps, shape, dtype=dtype
+            )
+        # Create a dictionary containig the scalar data (no velocity nor viscosity)
+        data_vars = {
+            scalar: (
+                dims,
+                _read_scalars(
+                    path, shape, steps, quantity=scalar, dtype=dtype, executor=executor
+                ),
+            )
+            for scalar in scalars
+        }
+        # Add velocity if needed
+        if "velocity" in datasets:
+            velocities = _read_velocity(
+                path, shape, steps, dtype=dtype, executor=executor
+            )
+            if dimension == 2:
+                data_vars["velocity_x"] = (dims, velocities[0])
+                data_vars["velocity_z"] = (dims, velocities[1])
+            elif dimension == 3:
+                data_vars["velocity_x"] = (dims, velocities[0])
+                data_vars["velocity_y"] = (dims, velocities[1])
+                data_vars["velocity_z"] = (dims, velocities[2])
 
     # Read viscosity if needed
     if "viscosity" in datasets:
+        # Add center coordinates of the finite elements to the coords
+        centers = _build_center_coordinates(
+            region=parameters["region"], shape=shape
+        )
         if dimension == 2:
             dims = ("time", "x_center", "z_center")
-            # Add center coordinates of the finite elements to the coords
-            coords["x_center"] = (coordinates[0][1:] + coordinates[0][:-1]) / 2
-            coords["z_center"] = (coordinates[1][1:] + coordinates[1][:-1]) / 2
+            coords["x_center"], coords["z_center"] = centers
         elif dimension == 3:
             dims = ("time", "x_center", "y_center", "z_center")
-            # Add center coordinates of the finite elements to the coords
-            coords["x_center"] = (coordinates[0][1:] + coordinates[0][:-1]) / 2
-            coords["y_center"] = (coordinates[1][1:] + coordinates[1][:-1]) / 2
-            coords["z_center"] = (coordinates[2][1:] + coordinates[2][:-1]) / 2
+            coords["x_center"], coords["y_center"], coords["z_center"] = centers
         # Add viscosity values located on the center of the finite elements
-        viscosity = _read_viscosity(path, steps, shape)
-        data_vars["viscosity"] = (dims, viscosity)
+        data_vars["viscosity"] = (dims, future_viscosity.result())
+
+    dataset = xr.Dataset(data_vars, coords=coords, attrs=parameters)
+    # Store the parsed dataset so the next read skips the text parsing
+    if cache:
+        dataset.to_netcdf(cache_file, engine="scipy")
+    return dataset
+
+
+def _cache_filename(parameters_file, datasets, dtype):
+    """
+    Build the netCDF cache filename for a combination of read arguments
+
+    The requested datasets and dtype are part of the name through a short digest, so
+    different read configurations of the same directory get separate cache files.
+    """
+    key = "|".join((parameters_file,) + tuple(datasets) + (dtype.name,))
+    digest = hashlib.md5(key.encode()).hexdigest()[:8]
+    return "mandyoc_cache_{}.nc".format(digest)
+
+
+def _load_cached_dataset(cache_file, parameters):
+    """
+    Load a cached dataset from disk, returning None if it is missing or stale
+
+    The cache is considered stale when the grid shape or region stored in its
+    attributes no longer matches the parameters file.
+    """
+    if not os.path.isfile(cache_file):
+        return None
+    dataset = xr.load_dataset(cache_file, engine="scipy")
+    for attribute in ("shape", "region"):
+        if not np.array_equal(dataset.attrs.get(attribute), parameters[attribute]):
+            return None
+    return dataset
 
-    return xr.Dataset(data_vars, coords=coords, attrs=parameters)
 
+@functools.lru_cache(maxsize=8)
+def _build_center_coordinates(region, shape):
+    """
+    Create coordinates for the centers of the finite elements
+
+    Since the nodes are evenly spaced, the centers are themselves a linspace shifted
+    inwards by half the grid spacing, built in one allocation per direction instead
+    of averaging the neighbouring nodes through temporaries. Memoized on ``region``
+    and ``shape`` like the node coordinates.
+
+    Parameters
+    ----------
+    region : tuple
+        Boundary coordinates for each direction (same convention as
+        :func:`_build_coordinates`).
+    shape : tuple
+        Number of nodes for each direction.
+
+    Returns
+    -------
+    centers : tuple
+        Tuple containing the center coordinates in the same order as the node
+        coordinates. Each direction has one element less than the nodes.
+    """
+    centers = []
+    for minimum, maximum, size in zip(region[0::2], region[1::2], shape):
+        half_spacing = (maximum - minimum) / (2 * (size - 1))
+        centers.append(
+            np.linspace(minimum + half_spacing, maximum - half_spacing, size - 1)
+        )
+    return tuple(centers)
 
+
+@functools.lru_cache(maxsize=8)
 def _build_coordinates(region, shape):
     """
     Create grid coordinates
 
+    The coordinate arrays are memoized on ``region`` and ``shape``, so reading several
+    datasets from the same model run reuses the same arrays instead of rebuilding them.
+
     Parameters
     ----------
     region : tuple
@@ -163,7 +298,30 @@ def _build_coordinates(region, shape):
         return x, y, z
 
 
-def _read_scalars(path, shape, steps, quantity):
+def _parse_step_file(path, filename):
+    """
+    Parse a single MANDYOC output file into a flat array
+
+    The file is parsed through the pandas C tokenizer, which is much faster than
+    np.loadtxt on the large ASCII dumps written by MANDYOC. Values smaller than
+    1e-200 in absolute value are flushed to zero.
+    """
+    data_step = pd.read_csv(
+        os.path.join(path, filename),
+        sep=r"\s+",
+        header=None,
+        comment="P",
+        skiprows=2,
+        dtype=np.float64,
+        engine="c",
+    ).to_numpy(copy=True).ravel()
+    # Convert very small numbers to zero, writing in place instead of scattering
+    # through a fancy boolean index
+    np.copyto(data_step, 0, where=np.abs(data_step) < 1.0e-200)
+    return data_step
+
+
+def _read_scalars(path, shape, steps, quantity, dtype=np.float64, executor=None):
     """
     Read MADYOC output scalar data
 
@@ -180,29 +338,31 @@ def _read_scalars(path, shape, steps, quantity):
         Array containing the saved steps.
     quantity : str
         Type of scalar data to be read.
+    dtype : data-type (optional)
+        Type for the output array. Default to ``numpy.float64``.
+    executor : :class:`concurrent.futures.Executor` or None (optional)
+        Executor used to parse the per-step files concurrently. If None, the files
+        are parsed one after another.
 
     Returns
     -------
     data: np.array
         Array containing the MADYOC output scalar data.
     """
-    data = []
-    for step in steps:
-        filename = "{}_{}.txt".format(BASENAMES[quantity], step)
-        data_step = np.loadtxt(
-            os.path.join(path, filename), unpack=True, comments="P", skiprows=2
-        )
-        # Convert very small numbers to zero
-        data_step[np.abs(data_step) < 1.0e-200] = 0
-        # Reshape data_step
-        data_step = data_step.reshape(shape, order="F")
-        # Append data_step to data
-        data.append(data_step)
-    data = np.array(data)
+    filenames = ["{}_{}.txt".format(BASENAMES[quantity], step) for step in steps]
+    # Parse the per-step files, concurrently if an executor was provided
+    files_map = executor.map if executor is not None else map
+    parsed = files_map(functools.partial(_parse_step_file, path), filenames)
+    # Preallocate the output array and fill it one step at a time, instead of growing
+    # a list and paying a full copy on the final np.array call
+    data = np.empty((steps.size,) + tuple(shape), dtype=dtype)
+    for index, data_step in enumerate(parsed):
+        # Reshape data_step and add it to data
+        data[index] = data_step.reshape(shape, order="F")
     return data
 
 
-def _read_velocity(path, shape, steps):
+def _read_velocity(path, shape, steps, dtype=np.float64, executor=None):
     """
     Read MADYOC output velocity data
 
@@ -214,40 +374,42 @@ def _read_velocity(path, shape, steps):
         Shape of the expected grid.
     steps : array
         Array containing the saved steps.
+    dtype : data-type (optional)
+        Type for the output arrays. Default to ``numpy.float64``.
+    executor : :class:`concurrent.futures.Executor` or None (optional)
+        Executor used to parse the per-step files concurrently. If None, the files
+        are parsed one after another.
 
     Returns
     -------
     data: tuple of arrays
-        Tuple containing the components of the velocity vector.
+        Tuple containing the components of the velocity vector. The components are
+        views into a single contiguous ``(dimension, n_steps, ...)`` buffer, so
+        kernels combining them (e.g. a velocity magnitude) stream one allocation
+        instead of jumping between independent arrays.
     """
     # Determine the dimension of the velocity data
     dimension = len(shape)
-    velocity_x, velocity_z = [], []
-    if dimension == 3:
-        velocity_y = []
-    for step in steps:
-        filename = "{}_{}.txt".format(BASENAMES["velocity"], step)
-        velocity = np.loadtxt(os.path.join(path, filename), comments="P", skiprows=2)
-        # Convert very small numbers to zero
-        velocity[np.abs(velocity) < 1.0e-200] = 0
-        # Separate velocity into their three components
-        if dimension == 2:
-            velocity_x.append(velocity[0::dimension].reshape(shape, order="F"))
-            velocity_z.append(velocity[1::dimension].reshape(shape, order="F"))
-        elif dimension == 3:
-            velocity_x.append(velocity[0::dimension].reshape(shape, order="F"))
-            velocity_y.append(velocity[1::dimension].reshape(shape, order="F"))
-            velocity_z.append(velocity[2::dimension].reshape(shape, order="F"))
-    # Transform the velocity_* lists to arrays
-    velocity_x = np.array(velocity_x)
-    velocity_z = np.array(velocity_z)
-    if dimension == 3:
-        velocity_y = np.array(velocity_y)
-        return (velocity_x, velocity_y, velocity_z)
-    return (velocity_x, velocity_z)
-
-
-def _read_viscosity(path, steps, shape):
+    filenames = [
+        "{}_{}.txt".format(BASENAMES["velocity"], step) for step in steps
+    ]
+    # Parse the per-step files, concurrently if an executor was provided
+    files_map = executor.map if executor is not None else map
+    parsed = files_map(functools.partial(_parse_step_file, path), filenames)
+    # Preallocate one contiguous buffer holding every component and fill it one step
+    # at a time, instead of growing lists and paying a full copy on the final
+    # np.array calls
+    velocity = np.empty((dimension, steps.size) + tuple(shape), dtype=dtype)
+    for index, velocity_step in enumerate(parsed):
+        # Separate velocity into their components
+        for component in range(dimension):
+            velocity[component, index] = velocity_step[
+                component::dimension
+            ].reshape(shape, order="F")
+    return tuple(velocity)
+
+
+def _read_viscosity(path, steps, shape, dtype=np.float64):
     """
         Read the viscosity files generated by MADYOC. The viscosity values are defined on
     the
@@ -257,6 +419,8 @@ def _read_viscosity(path, steps, shape):
         ----------
         path : str
             Path to the folder where the MADYOC output files are located.
+        dtype : data-type (optional)
+            Type for the output array. Default to ``numpy.float64``.
 
         Returns
         -------
@@ -267,37 +431,51 @@ def _read_viscosity(path, steps, shape):
     dimension = len(shape)
     # The number of finite elements per axe is the number of nodes minus one
     shape_centers = tuple(i - 1 for i in shape)
-    # List all viscosity_files
-    viscosity_files = [i for i in os.listdir(path) if BASENAMES["viscosity"] in i]
+    # Count the rank files of every step with a single directory scan, instead of
+    # rescanning the full file listing once per step
+    pattern = re.compile(re.escape(BASENAMES["viscosity"]) + r"(\d+)_\d+\.txt")
+    ranks_per_step = Counter()
+    for entry in os.scandir(path):
+        match = pattern.fullmatch(entry.name)
+        if match:
+            ranks_per_step[int(match.group(1))] += 1
     # Initialize the viscosity array with the proper shape: (n_steps, nx, ...)
     full_shape = tuple([steps.size] + list(shape_centers))
-    viscosity = np.zeros(full_shape, dtype=float)
+    viscosity = np.zeros(full_shape, dtype=dtype)
     # Fill the viscosity array with elements read from the data files
     for step_index, step in enumerate(steps):
         # Determine the rank value on the first step and check it for following steps
-        step_files = [
-            i
-            for i in viscosity_files
-            if "{}{}_".format(BASENAMES["viscosity"], step) in i
-        ]
         if step_index == 0:
-            n_rank = len(step_files)
+            n_rank = ranks_per_step[step]
         else:
-            if len(step_files) != n_rank:
+            if ranks_per_step[step] != n_rank:
                 raise ValueError(
                     "Invalid number of ranks '{}' for step '{}'".format(
-                        len(step_files), step
+                        ranks_per_step[step], step
                     )
                 )
         # Read rank file for this step and add the viscosity results to viscosity array
+        # The leading columns are the integer indices of the finite element; parse
+        # them as integers right away instead of reading floats and paying an
+        # astype copy per column
+        dtypes = {column: np.intp for column in range(dimension)}
+        dtypes[dimension] = np.float64
         for rank in range(n_rank):
             filename = "visc_{}_{}.txt".format(step, rank)
+            # Parse the file through the pandas C tokenizer, which is much faster
+            # than np.loadtxt on the large ASCII dumps written by MANDYOC
+            frame = pd.read_csv(
+                os.path.join(path, filename),
+                sep=r"\s+",
+                header=None,
+                dtype=dtypes,
+                engine="c",
+            )
+            columns = [frame[column].to_numpy() for column in range(dimension + 1)]
             if dimension == 2:
-                i, k, visc = np.loadtxt(os.path.join(path, filename), unpack=True)
-                i, k = i.astype(int), k.astype(int)
+                i, k, visc = columns
                 viscosity[step_index, i, k] = visc
             elif dimension == 3:
-                i, j, k, visc = np.loadtxt(os.path.join(path, filename), unpack=True)
-                i, j, k = i.astype(int), j.astype(int), k.astype(int)
+                i, j, k, visc = columns
                 viscosity[step_index, i, j, k] = visc
     return viscosity
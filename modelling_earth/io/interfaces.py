@@ -2,6 +2,7 @@
 Save interfaces and layers data to ASCII files ready to be read by MANDYOC
 """
 import numpy as np
+import pandas as pd
 import os
 
 FLAGS = {
@@ -66,20 +67,23 @@ def save_interfaces(interfaces, layers_parameters, path, fname=FNAME):
     else:
         expected_dims = "x"
     interfaces = interfaces.transpose(*expected_dims)
-    # Stack and ravel the interfaces from the dataset
+    # Ravel the interfaces from the dataset into a preallocated array, one column per
+    # interface: hstacking reshaped ravels would build a temporary copy per interface
     # We will use order "F" on numpy.ravel in order to make the first index to change
     # faster than the rest
-    stacked_interfaces = np.hstack(
-        list(interfaces[i].values.ravel(order="F")[:, np.newaxis] for i in interfaces)
-    )
-    # Save the interface and the layers parameters
-    np.savetxt(
-        os.path.join(path, fname),
-        stacked_interfaces,
-        fmt="%f",
-        header=header,
-        comments="",
+    names = list(interfaces)
+    stacked_interfaces = np.empty(
+        (interfaces[names[0]].size, len(names)), dtype=np.float64
     )
+    for column, name in enumerate(names):
+        stacked_interfaces[:, column] = interfaces[name].values.ravel(order="F")
+    # Save the interface and the layers parameters, formatting the rows through the
+    # pandas C writer: np.savetxt interpolates a Python format string per row
+    with open(os.path.join(path, fname), "w") as outfile:
+        outfile.write(header + "\n")
+        pd.DataFrame(stacked_interfaces).to_csv(
+            outfile, sep=" ", float_format="%f", header=False, index=False
+        )
 
 
 def _check_order_of_interfaces(interfaces):
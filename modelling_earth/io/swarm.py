@@ -2,6 +2,10 @@
 Read and write swarm data
 """
 import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import xarray as xr
 import pandas as pd
@@ -39,55 +43,90 @@ def read_mandyoc_swarm(path, parameters_file=PARAMETERS_FILE):
     print_step = parameters["print_step"]
     max_steps = parameters["stepMAX"]
     steps, times = _read_times(path, print_step, max_steps)
-    # Get swarm files
-    swarm_files = [i for i in os.listdir(path) if SWARM_BASENAME in i]
-    # Initialize the list of dataframes that will be concatenated
+    # Count the rank files of every step with a single directory scan, instead of
+    # rescanning the full file listing once per step
+    pattern = re.compile(re.escape(SWARM_BASENAME) + r"(\d+)-rank_new\d+\.txt")
+    ranks_per_step = Counter()
+    for entry in os.scandir(path):
+        match = pattern.fullmatch(entry.name)
+        if match:
+            ranks_per_step[int(match.group(1))] += 1
+    if dimension == 2:
+        usecols = (0, 1, 2)
+    else:
+        usecols = (0, 1, 2, 3)
+    # Submit every rank file of every step to a single thread pool before collecting
+    # any result: the files are independent and the pandas C parser releases the GIL,
+    # so the parses overlap across ranks and across steps instead of one step at a
+    # time. The futures keep the submission order, preserving the particle ordering
+    # of a serial read.
     dataframes = []
-    # Read the data
-    for i, (step, time) in enumerate(zip(steps, times)):
-        # Determine the rank value on the first step and check it for following steps
-        step_files = [
-            i for i in swarm_files if "{}{}-".format(SWARM_BASENAME, step) in i
-        ]
-        if i == 0:
-            n_rank = len(step_files)
-        else:
-            if len(step_files) != n_rank:
-                raise ValueError(
-                    "Invalid number of ranks '{}' for step '{}'".format(
-                        len(step_files), step
+    with ThreadPoolExecutor() as executor:
+        step_futures = []
+        for i, step in enumerate(steps):
+            # Determine the rank value on the first step and check it for following
+            # steps
+            if i == 0:
+                n_rank = ranks_per_step[step]
+            else:
+                if ranks_per_step[step] != n_rank:
+                    raise ValueError(
+                        "Invalid number of ranks '{}' for step '{}'".format(
+                            ranks_per_step[step], step
+                        )
                     )
-                )
-        # Read particles positions for the current step
-        dataframes.append(
-            _read_mandyoc_single_swarm(path, step, time, n_rank, dimension)
-        )
+            step_futures.append(
+                [
+                    executor.submit(_parse_swarm_rank, path, step, rank, usecols)
+                    for rank in range(n_rank)
+                ]
+            )
+        # Build the per-step dataframes as the parses complete
+        for futures, step, time in zip(step_futures, steps, times):
+            rank_data = [future.result() for future in futures]
+            dataframes.append(_build_swarm_dataframe(rank_data, step, time, dimension))
     # Concatenate the dataframes
     swarm = pd.concat(dataframes)
     return swarm
 
 
-def _read_mandyoc_single_swarm(path, step, time, n_rank, dimension):
+def _parse_swarm_rank(path, step, rank, usecols):
+    """
+    Read the particles file of a single rank through the pandas C parser
+
+    The C parser tokenizes the whole file in a single pass instead of looping over
+    lines in Python.
+    """
+    filename = "{}{}-rank_new{}.txt".format(SWARM_BASENAME, step, rank)
+    return pd.read_csv(
+        os.path.join(path, filename),
+        sep=r"\s+",
+        header=None,
+        usecols=usecols,
+        dtype=np.float64,
+        engine="c",
+    ).to_numpy()
+
+
+def _build_swarm_dataframe(rank_data, step, time, dimension):
     """
-    Read swarm positions for a single time step from MANDYOC output files
+    Assemble the particle positions of a single time step into a dataframe
     """
-    x, y, z, cc0 = tuple(np.array([]) for i in range(4))
-    for rank_i in range(n_rank):
-        filename = "{}{}-rank_new{}.txt".format(SWARM_BASENAME, step, rank_i)
+    # Collect the per-rank arrays in lists and concatenate them once at the end:
+    # stacking after each rank would copy the accumulated arrays on every iteration
+    x, y, z, cc0 = [], [], [], []
+    for data_rank in rank_data:
         if dimension == 2:
-            x_rank, z_rank, cc0_rank = np.loadtxt(
-                os.path.join(path, filename), unpack=True, usecols=(0, 1, 2)
-            )
+            x_rank, z_rank, cc0_rank = data_rank.T
         elif dimension == 3:
-            x_rank, y_rank, z_rank, cc0_rank = np.loadtxt(
-                os.path.join(path, filename), unpack=True, usecols=(0, 1, 2, 3)
-            )
-        # Stack arrays in sequence horizontally
-        cc0 = np.hstack((cc0, cc0_rank))
-        x = np.hstack((x, x_rank))
-        z = np.hstack((z, z_rank))
-        if dimension == 3:
-            y = np.hstack((y, y_rank))
+            x_rank, y_rank, z_rank, cc0_rank = data_rank.T
+            y.append(y_rank)
+        x.append(x_rank)
+        z.append(z_rank)
+        cc0.append(cc0_rank)
+    x, z, cc0 = np.concatenate(x), np.concatenate(z), np.concatenate(cc0)
+    if dimension == 3:
+        y = np.concatenate(y)
     # Create a data frame for the current step
     data = {"x": x, "z": z, "cc0": cc0, "time": time}
     if dimension == 3:
@@ -2,6 +2,8 @@
 Utility functions for reading and writing data from/to files
 """
 import os
+import re
+import functools
 import numpy as np
 
 TIMES_BASENAME = "Tempo_"
@@ -10,7 +12,31 @@ PARAMETERS_FILE = "param_1.5.3_2D.txt"
 
 def _read_parameters(parameters_file):
     """
-    Read parameters file
+    Read parameters file, caching the result of the parse
+
+    The parameters file is parsed only once per file: subsequent calls with the same
+    file return the cached values. The modification time of the file takes part of
+    the cache key, so editing the parameters invalidates the cached entry. A copy of
+    the cached dictionary is returned so callers can safely modify it.
+
+    Parameters
+    ----------
+    parameters_file : str
+        Path to the location of the parameters file.
+
+    Returns
+    -------
+    parameters : dict
+        Dictionary containing the parameters of MANDYOC output files.
+    """
+    mtime = os.path.getmtime(parameters_file)
+    return dict(_parse_parameters(parameters_file, mtime))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_parameters(parameters_file, mtime):
+    """
+    Parse parameters file
 
     .. warning :
 
@@ -23,6 +49,9 @@ def _read_parameters(parameters_file):
     ----------
     parameters_file : str
         Path to the location of the parameters file.
+    mtime : float
+        Modification time of the parameters file. Not used while parsing: it only
+        keys the cache so a modified file is parsed again.
 
     Returns
     -------
@@ -30,34 +59,23 @@ def _read_parameters(parameters_file):
         Dictionary containing the parameters of MANDYOC output files.
     """
     parameters = {}
-    read_shape, read_max_coords = False, False
+    # Split the non-blank lines in a single pass: the first line is the shape, the
+    # second one the maximum coordinates and the rest are key-value parameters
     with open(parameters_file, "r") as params_file:
-        for line in params_file:
-            # Skip blank lines
-            if not line.strip():
-                continue
-            # Read number of coordinates per direction
-            if not read_shape:
-                parameters["shape"] = tuple(int(i) for i in line.split())
-                read_shape = True
-                # Determine the dimension of the data
-                dimension = len(parameters["shape"])
-                continue
-            # Read maximum coordinates per direction
-            if not read_max_coords:
-                max_coords = tuple(float(i) for i in line.split())
-                read_max_coords = True
-                # Assert that the dimension matches the one read in shape
-                assert len(max_coords) == dimension
-                continue
-            # Read more parameters
-            key, value = line.split()
-            if key in "print_step stepMAX".split():
-                parameters[key] = int(value)
-            elif key == "timeMAX":
-                parameters[key] = float(value)
-            else:
-                parameters[key] = value
+        lines = [line.split() for line in params_file if line.strip()]
+    # Read number of coordinates per direction
+    parameters["shape"] = tuple(int(i) for i in lines[0])
+    # Determine the dimension of the data
+    dimension = len(parameters["shape"])
+    # Read maximum coordinates per direction
+    max_coords = tuple(float(i) for i in lines[1])
+    # Assert that the dimension matches the one read in shape
+    assert len(max_coords) == dimension
+    # Read more parameters, dispatching the value conversion through a table
+    # instead of branching on the key per line
+    converters = {"print_step": int, "stepMAX": int, "timeMAX": float}
+    for key, value in lines[2:]:
+        parameters[key] = converters.get(key, str)(value)
     # Add extrime values for the axis according to the dimension
     parameters["dimension"] = dimension
     if dimension == 2:
@@ -104,17 +122,24 @@ def _read_times(path, print_step, max_steps):
         times : numpy array
             Array containing the time of each step in Ma.
     """
+    # List the available time files with a single directory scan instead of probing
+    # the filesystem once per candidate step
+    pattern = re.compile(re.escape(TIMES_BASENAME) + r"(\d+)\.txt$")
+    available_steps = set()
+    for entry in os.scandir(path):
+        match = pattern.fullmatch(entry.name)
+        if match:
+            available_steps.add(int(match.group(1)))
     steps, times = [], []
     for step in range(0, max_steps + print_step, print_step):
-        filename = os.path.join(path, "{}{}.txt".format(TIMES_BASENAME, step))
-        if not os.path.isfile(filename):
+        if step not in available_steps:
             break
-        time = np.loadtxt(filename, unpack=True, delimiter=":", usecols=(1))
-        if time.shape == ():
-            time.append(time)
-        else:
-            time = time[0]
-            times.append(time)
+        filename = os.path.join(path, "{}{}.txt".format(TIMES_BASENAME, step))
+        # Every rank writes the same time, one line each: read only the first line
+        # instead of parsing the whole file with np.loadtxt
+        with open(filename, "r") as time_file:
+            time = float(time_file.readline().split(":")[1])
+        times.append(time)
         steps.append(step)
 
     # Transforms lists to arrays
@@ -38,4 +38,4 @@ def save_velocity(velocity, path, fname=FNAME):
         (np.size(velocity_to_save))
         )
     # Will add a custom header required by MANDYOC
-    return np.savetxt(os.path.join(path, fname), velocity_to_save, header=HEADER)
+    np.savetxt(os.path.join(path, fname), velocity_to_save, header=HEADER)
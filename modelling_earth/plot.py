@@ -24,7 +24,15 @@ def plot_velocity_2d(dataset, ax, slice_grid=4, **kwargs):
         on the ``x`` and ``z`` directions, respectively. Default to 4.
     kwargs : dict
         Keyword arguments passed to :meth:`matplotlib.Axes.quiver`.
+
+    Returns
+    -------
+    quiver : :class:`matplotlib.quiver.Quiver`
+        The quiver artist added to the axe.
     """
+    # Keep only the velocity components so the slicing below doesn't build sliced
+    # copies of every other data variable in the dataset
+    dataset = dataset[["velocity_x", "velocity_z"]]
     # Slice the dataset
     if slice_grid is not None:
         if type(slice_grid) is int:
@@ -40,7 +48,7 @@ def plot_velocity_2d(dataset, ax, slice_grid=4, **kwargs):
             dict(x=slice(None, None, slice_x), z=slice(None, None, slice_z))
         ]
     # Plot the velocity
-    ax.quiver(
+    return ax.quiver(
         dataset.x,
         dataset.z,
         dataset.velocity_x.values.T,
@@ -72,7 +80,7 @@ def plot_scalar_2d(dataarray, ax, **kwargs):
     return dataarray.plot.pcolormesh(ax=ax, x="x", y="z", **kwargs)
 
 
-def plot_swarm_2d(swarm, ax, **kwargs):
+def plot_swarm_2d(swarm, ax, density=False, bins=(800, 400), **kwargs):
     """
     Plot an scatter of the particle position for a defined time step
 
@@ -86,11 +94,36 @@ def plot_swarm_2d(swarm, ax, **kwargs):
         correspond to the step number.
     ax : :class:`matplotlib:Axes`
         Axe where the plot will be added.
+    density : bool (optional)
+        If ``True`` the particles will be rendered as a density image obtained by
+        binning their positions, instead of one scatter marker per particle. Use it
+        for swarms with a very large number of particles, where matplotlib would
+        build one artist per point. Default ``False``.
+    bins : int or tuple (optional)
+        Number of bins per axis used to build the density image. Only used if
+        ``density`` is ``True``. Default to ``(800, 400)``.
     kwargs : dict
         Keyword arguments passed to :func:`matplotlib.pyplot.scatter`. By default the
         marker size ``s`` , the ``color`` and the alpha blending value ``alpha`` will
-        be 0.2, 'black' and 0.3 respectively.
+        be 0.2, 'black' and 0.3 respectively. If ``density`` is ``True``, they are
+        passed to :func:`matplotlib.pyplot.imshow` instead, with the colormap
+        defaulting to 'Greys'.
     """
+    # Render the particles as a binned density image: same information on screen,
+    # a single image artist instead of one path per particle
+    if density:
+        if "cmap" not in kwargs:
+            kwargs["cmap"] = "Greys"
+        if "alpha" not in kwargs:
+            kwargs["alpha"] = 0.6
+        counts, x_edges, z_edges = np.histogram2d(swarm.x, swarm.z, bins=bins)
+        return ax.imshow(
+            counts.T,
+            origin="lower",
+            extent=[x_edges[0], x_edges[-1], z_edges[0], z_edges[-1]],
+            aspect="auto",
+            **kwargs,
+        )
     # Fix some parameter un the kwargs
     if "s" not in kwargs:
         kwargs["s"] = 0.2
@@ -153,7 +186,7 @@ def save_plots_2d(
     show : bool (optional)
         If ``True`` each figure will be shown after saved. Default ``False``.
     kwargs : dict (optional)
-        Keyword arguments for :func:`matplotlib.pyplot.subplots` function.
+        Keyword arguments for :func:`matplotlib.pyplot.figure` function.
 
     """
     if not os.path.isdir(save_path):
@@ -170,14 +203,23 @@ def save_plots_2d(
         vmax = getattr(dataset, scalar_to_plot).max()
     # Get max number of digits on steps
     number_of_digits = len(str(dataset.step.values.max()))
+    # Split the swarm by step once: looking the step up with .loc on every frame
+    # would search the index and copy the selection each time
+    if swarm is not None:
+        swarm_by_step = dict(iter(swarm.groupby(level=0, sort=False)))
     # Initialize quiver to None
     quiver = None
-    # Generate figure
+    # Create a single figure and reuse it on every time step: building a fresh figure
+    # and backend canvas per frame is the dominant cost of the saving loop
+    fig = plt.figure(**kwargs)
     for step, time in zip(dataset.step.values, dataset.time.values):
-        fig, ax = plt.subplots(**kwargs)
+        # Select the current time step only once per iteration
+        dataset_step = dataset.sel(time=time)
+        fig.clf()
+        ax = fig.add_subplot()
         if scalar_to_plot:
             plot_scalar_2d(
-                getattr(dataset.sel(time=time), scalar_to_plot),
+                getattr(dataset_step, scalar_to_plot),
                 ax=ax,
                 vmin=vmin,
                 vmax=vmax,
@@ -189,21 +231,20 @@ def save_plots_2d(
             else:
                 scale = quiver.scale
             quiver = plot_velocity_2d(
-                dataset.sel(time=time), ax=ax, scale=scale, **velocity_kwargs
+                dataset_step, ax=ax, scale=scale, **velocity_kwargs
             )
         if swarm is not None:
-            plot_swarm_2d(swarm.loc[step], ax=ax, **swarm_kwargs)
+            plot_swarm_2d(swarm_by_step[step], ax=ax, **swarm_kwargs)
         # Configure plot
         ax.set_aspect("equal")
         ax.ticklabel_format(axis="both", style="sci", scilimits=(0, 0))
-        plt.tight_layout()
+        fig.tight_layout()
         # Save the plot
         figure_name = "{}_{}.{}".format(
             filename, str(step).zfill(number_of_digits), figure_format
         )
-        plt.savefig(os.path.join(save_path, figure_name), dpi=dpi)
+        fig.savefig(os.path.join(save_path, figure_name), dpi=dpi)
         if show:
             plt.show()
-        plt.clf()
     print("All figures have been successfully saved on {}".format(save_path))
-    plt.close("all")
+    plt.close(fig)
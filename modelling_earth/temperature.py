@@ -5,7 +5,7 @@ import numpy as np
 import xarray as xr
 from warnings import warn
 
-from .coordinates import create_grid
+from .coordinates import create_grid, get_shape
 from .utilities import linear_depth
 
 # Define default parameters for building temperature distributions
@@ -79,22 +79,23 @@ def litho_astheno_temperatures(
             "Passed lid_depth has positive values. "
             + "It must be negative in order the LID to be bellow the surface."
         )
-    # Initialize temperatures array
-    temperatures = create_grid(coordinates)
     # Convert lid_depth to xarray.DataArray if it's a float
     if type(lid_depth) is float or type(lid_depth) is int:
-        lid_depth = xr.full_like(temperatures.sel(z=temperatures.z[0]), lid_depth)
-    # Compute temperature distribution for lithosphere (linear)
-    temperatures += (
+        horizontal_dims = [dim for dim in coordinates.dims if dim != "z"]
+        lid_depth = xr.DataArray(
+            np.full(get_shape(coordinates)[:-1], lid_depth),
+            coords=[coordinates[dim] for dim in horizontal_dims],
+        )
+    # Compute temperature distribution for lithosphere (linear) by broadcasting the
+    # lid depth against the vertical coordinate, so no dense zero-filled grid needs to
+    # be allocated and filled beforehand
+    z = coordinates["z"]
+    temperatures = (
         lid_temperature - surface_temperature
-    ) / lid_depth * temperatures.z + surface_temperature
+    ) / lid_depth * z + surface_temperature
     # Add exponential temperature for the asthenosphere
     astheno_temperatures = potential_astheno_surface_temp * np.exp(
-        (-1)
-        * coeff_thermal_expansion
-        * gravity_acceleration
-        / specific_heat
-        * temperatures.z
+        (-1) * coeff_thermal_expansion * gravity_acceleration / specific_heat * z
     )
     # Merge both distributions ensuring continuity
     temperatures = xr.where(
@@ -1,8 +1,19 @@
 """
 Utilities functions to create the interfaces
 """
+import functools
+import math
 
-import numpy as np
+
+@functools.lru_cache(maxsize=16)
+def _slope_tangent(slope):
+    """
+    Tangent of a slope given in degrees, memoized on the slope value
+
+    Scripts usually evaluate several interfaces with the same slope, so caching the
+    tangent avoids recomputing the same trigonometric functions on every call.
+    """
+    return math.tan(math.radians(slope))
 
 
 def linear_depth(x, slope, point):
@@ -33,7 +44,7 @@ def linear_depth(x, slope, point):
         Value in the ``z`` axis obtained from evaluating the linear function.
     """
     x_p, z_p = point[:]
-    return -np.tan(np.radians(slope)) * (x - x_p) + z_p
+    return -_slope_tangent(slope) * (x - x_p) + z_p
 
 
 def quadratic_depth(x, point_1, point_2):